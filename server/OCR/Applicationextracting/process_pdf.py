@@ -11,7 +11,9 @@ except ImportError:
 # For image‐based OCR
 from pdf2image import convert_from_path
 from PIL import Image, ImageOps, ImageFilter
-import pytesseract
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from ocr_engine import image_to_string
 
 # Configure logging
 logging.basicConfig(
@@ -62,7 +64,7 @@ def scan_pdf_text(pdf_path: str, dpi=DPI, threshold=THRESH, median=MEDIAN, white
         cfg = "--psm 3 -l eng+hin+mar"
 
         try:
-            parts.append(pytesseract.image_to_string(img, config=cfg))
+            parts.append(image_to_string(img, config=cfg))
         except Exception as ocr_err:
             logging.error(f"[scan_pdf_text] tesseract failed: {ocr_err}")
     return "\n".join(parts).strip()
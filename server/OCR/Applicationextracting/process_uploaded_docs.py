@@ -2,9 +2,11 @@
 import sys, os, json, logging, re
 from pdf2image import convert_from_path
 from PIL import Image, ImageOps, ImageFilter
-import pytesseract
 import traceback
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from ocr_engine import image_to_string
+
 # Optional Windows path – adjust if needed:
 # pytesseract.pytesseract.tesseract_cmd = r"C:\Program Files\Tesseract-OCR\tesseract.exe"
 
@@ -65,7 +67,7 @@ def ocr_clean(pdf_path):
             img = img.convert("L")
             img = ImageOps.autocontrast(img)
             img = img.filter(ImageFilter.SHARPEN)
-            text = pytesseract.image_to_string(img, lang="eng+hin+mar", config="--psm 3")
+            text = image_to_string(img, lang="eng+hin+mar", config="--psm 3")
             parts.append(text)
 
         return "\n".join(parts).strip(), "tesseract-simple"
@@ -86,7 +88,7 @@ def ocr_scan(pdf_path):
 
         cfg = "--psm 3 -l eng+hin+mar"
 
-        parts.append(pytesseract.image_to_string(img, config=cfg))
+        parts.append(image_to_string(img, config=cfg))
     return "\n".join(parts).strip(), "tesseract-scan"
 
 def extract_fields_from_text(text):
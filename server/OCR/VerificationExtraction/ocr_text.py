@@ -1,10 +1,13 @@
 #!/usr/bin/env python
-import sys
+import os, sys
 import re
 from pdf2image import convert_from_path
 from PIL import Image, ImageFilter, ImageOps
 import pytesseract
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from ocr_engine import image_to_string
+
 # 1️⃣ Tell pytesseract where to find your tesseract.exe
 pytesseract.pytesseract.tesseract_cmd = r"C:\Program Files\Tesseract-OCR\tesseract.exe"
 
@@ -18,11 +21,11 @@ def preprocess_image(page, threshold, median_sz):
 def ocr_digits(page, threshold, median_sz):
     img = preprocess_image(page, threshold, median_sz)
     cfg = "--psm 6 -c tessedit_char_whitelist=0123456789-/"
-    return pytesseract.image_to_string(img, config=cfg)
+    return image_to_string(img, config=cfg)
 
 def ocr_raw(page, threshold, median_sz):
     img = preprocess_image(page, threshold, median_sz)
-    return pytesseract.image_to_string(img)
+    return image_to_string(img)
 
 def main():
     if len(sys.argv) < 2:
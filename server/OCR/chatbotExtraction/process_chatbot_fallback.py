@@ -1,8 +1,33 @@
 
-import sys
-import tempfile
-from pdf2image import convert_from_path
-import pytesseract
+import os, sys
+import io
+import time
+import subprocess
+from pdf2image import pdfinfo_from_path
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from ocr_engine import image_to_string
+
+POPPLER_PATH = r"C:\Users\amrut\Downloads\Release-23.11.0-0\poppler-23.11.0\Library\bin"
+DPI = 300
+
+def render_pages(pdf_path, dpi=DPI, poppler_path=POPPLER_PATH):
+    """
+    Yield (page_no, grayscale PIL image) one page at a time.
+    pdftoppm writes PGM to stdout, so nothing is left on disk and there is
+    no JPEG encode/decode round trip.
+    """
+    page_count = pdfinfo_from_path(pdf_path, poppler_path=poppler_path)["Pages"]
+    pdftoppm = os.path.join(poppler_path, "pdftoppm") if poppler_path else "pdftoppm"
+    for page_no in range(1, page_count + 1):
+        proc = subprocess.run(
+            [pdftoppm, "-gray", "-r", str(dpi), "-f", str(page_no), "-l", str(page_no), pdf_path],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            check=True
+        )
+        yield page_no, Image.open(io.BytesIO(proc.stdout))
 
 def main():
     # Ensure a PDF path is provided
@@ -11,30 +36,34 @@ def main():
         sys.exit(1)
     pdf_path = sys.argv[1]
 
-    try:
-
-        poppler_path = r"C:\Users\amrut\Downloads\Release-23.11.0-0\poppler-23.11.0\Library\bin"
-        # Convert PDF pages to images
-        images = convert_from_path(
-            pdf_path,
-            dpi=300,
-            grayscale=True,
-            fmt="jpeg",
-            output_folder=tempfile.gettempdir(),
-            poppler_path=poppler_path
-        )
-    except Exception as e:
-        print(f"Error converting PDF to images: {e}", file=sys.stderr)
-        sys.exit(1)
-
+    pages = render_pages(pdf_path)
     all_text = []
-    # Run OCR on each page
-    for idx, img in enumerate(images, start=1):
+    # Rasterize and OCR each page; timings go to stderr so stdout stays pure text
+    while True:
+        start = time.perf_counter()
+        try:
+            idx, img = next(pages)
+        except StopIteration:
+            break
+        except Exception as e:
+            print(f"Error converting PDF to images: {e}", file=sys.stderr)
+            sys.exit(1)
+        rendered = time.perf_counter()
+
         try:
-            text = pytesseract.image_to_string(img, lang="eng+hin+mar")
+            text = image_to_string(img, lang="eng+hin+mar")
             all_text.append(text)
         except Exception as e:
             print(f"Error OCR page {idx}: {e}", file=sys.stderr)
+        finally:
+            img.close()
+        done = time.perf_counter()
+
+        print(
+            f"Page {idx}: render {(rendered - start) * 1000:.0f} ms, "
+            f"ocr {(done - rendered) * 1000:.0f} ms, total {(done - start) * 1000:.0f} ms",
+            file=sys.stderr
+        )
 
     # Output the combined extracted text
     print("\n\n".join(all_text))
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Shared OCR backend for the extraction scripts.
+
+When tesserocr is installed, Tesseract is kept loaded in-process: one API
+handle per thread and (lang, psm, -c variables) combination, reused for every
+page. Images are handed over from memory, so there is no temp file and no
+`tesseract` subprocess per page. Without tesserocr (or if it fails to
+initialise) we fall back to pytesseract with the exact same config string.
+
+Backend choice via ENV:
+    OCR_ENGINE=auto|tesserocr|pytesseract   (default: auto)
+"""
+import os, shlex, logging, threading
+
+import pytesseract
+
+try:
+    import tesserocr
+except ImportError:
+    tesserocr = None
+
+ENGINE = os.getenv("OCR_ENGINE", "auto").lower()
+
+_local = threading.local()
+_failed = False
+
+
+def _parse_config(lang, config):
+    """Split a pytesseract-style config into (lang, psm, variables)."""
+    psm = 3  # tesseract CLI default (fully automatic page segmentation)
+    variables = {}
+    args = shlex.split(config or "")
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg == "--psm" and i + 1 < len(args):
+            psm = int(args[i + 1])
+            i += 1
+        elif arg == "-l" and i + 1 < len(args):
+            lang = args[i + 1]
+            i += 1
+        elif arg == "-c" and i + 1 < len(args):
+            key, _, value = args[i + 1].partition("=")
+            variables[key] = value
+            i += 1
+        else:
+            raise ValueError(f"unsupported option for in-process OCR: {arg}")
+        i += 1
+    return lang or "eng", psm, variables
+
+
+def _get_api(lang, psm, variables):
+    """Return a cached, initialised tesserocr handle for this thread."""
+    apis = getattr(_local, "apis", None)
+    if apis is None:
+        apis = _local.apis = {}
+    key = (lang, psm, tuple(sorted(variables.items())))
+    api = apis.get(key)
+    if api is None:
+        api = tesserocr.PyTessBaseAPI(lang=lang, psm=psm)
+        for name, value in variables.items():
+            if not api.SetVariable(name, value):
+                api.End()
+                raise ValueError(f"unknown tesseract variable: {name}")
+        apis[key] = api
+    return api
+
+
+def image_to_string(img, lang=None, config=""):
+    """Drop-in replacement for pytesseract.image_to_string(img, lang, config)."""
+    global _failed
+    if tesserocr is not None and ENGINE != "pytesseract" and not _failed:
+        try:
+            api = _get_api(*_parse_config(lang, config))
+        except Exception as e:
+            if ENGINE == "tesserocr":
+                raise
+            _failed = True
+            logging.warning(f"[ocr_engine] tesserocr unavailable, using pytesseract: {e}")
+        else:
+            api.SetImage(img)
+            return api.GetUTF8Text()
+    elif ENGINE == "tesserocr":
+        raise RuntimeError("OCR_ENGINE=tesserocr but tesserocr is not installed")
+
+    return pytesseract.image_to_string(img, lang=lang, config=config)